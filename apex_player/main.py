@@ -1,20 +1,47 @@
 import discord
-from discord.ext import tasks
 import aiohttp
+import orjson
 import asyncio
 import logging
 import os
 import sys
 import io
+import hashlib
+import json
+import time
+from collections import defaultdict
 from dataclasses import dataclass
+from pathlib import Path
 from typing import Optional
 from datetime import datetime
 from dotenv import load_dotenv
-from PIL import Image
+from PIL import Image, features
+from yarl import URL
 
 # ================= CONFIGURATION =================
 # How often to check stats (in seconds)
 STATS_CHECK_INTERVAL = 3600  # 1 hour (good balance between freshness and API rate limits)
+# Rate limit handling (429)
+API_MAX_ATTEMPTS = 3
+DEFAULT_RETRY_AFTER = 60  # used when the API doesn't tell us how long to wait
+MAX_RETRY_BACKOFF = 300
+# Max concurrent nickname edits per bot
+NICKNAME_MAX_CONCURRENCY = 5
+# Avatar uploads
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+MAX_AVATAR_BYTES = 10 * 1024 * 1024  # Discord upload limit
+AVATAR_SIZE = (256, 256)
+# How long to stop polling a UID the API reports as invalid/missing
+NEGATIVE_CACHE_TTL = 6 * 3600
+# Delay between bots on the first pass after startup, so every bot gets its status right away
+STARTUP_POLL_STAGGER = 3
+# Minimum time the poller waits for a bot to finish logging in before skipping it
+BOT_READY_MIN_TIMEOUT = 30
+# How long fetched stats are reused by other bots tracking the same UID
+STATS_CACHE_TTL = STATS_CHECK_INTERVAL - 60
+
+# Where bot state is persisted between restarts
+STATE_PATH = Path(os.getenv('STATE_DIR', '.')) / 'apex_state.json'
 
 # Logging Setup
 logging.basicConfig(
@@ -31,13 +58,101 @@ if not APEX_API_KEY:
     logging.fatal("Missing APEX_API_KEY in .env")
     raise ValueError("Missing APEX_API_KEY")
 
+# The Pillow fallback in update_avatar decodes JPEG badges faster with libjpeg-turbo.
+# This only checks for libjpeg-turbo, it can't tell whether the Pillow-SIMD build is installed.
+if not features.check('libjpeg_turbo'):
+    logging.warning("Pillow is not built with libjpeg-turbo; JPEG avatar decoding will be slower.")
+
+# Stats cache per player UID: uid -> (monotonic fetch time, payload)
+_STATS_CACHE: dict[str, tuple[float, dict]] = {}
+# UIDs the API rejected: uid -> monotonic time until which they aren't polled
+_NEGATIVE_CACHE: dict[str, float] = {}
+
+# Serializes writes to STATE_PATH across bots
+_STATE_LOCK = asyncio.Lock()
+
+def load_state_file() -> dict:
+    """Reads the persisted state of all bots, empty if missing or unreadable."""
+    try:
+        return json.loads(STATE_PATH.read_text())
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        logging.warning(f"Could not read state file {STATE_PATH}: {e}")
+        return {}
+
 @dataclass
 class PlayerConfig:
     """Configuration for a single player bot."""
     name: str
     discord_token: str
     player_uid: str
-    startup_delay: int = 0
+
+def get_retry_after(headers) -> float:
+    """Reads how long to back off from Retry-After / X-RateLimit-Reset-After headers."""
+    value = headers.get('Retry-After', headers.get('X-RateLimit-Reset-After'))
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return DEFAULT_RETRY_AFTER
+
+async def discord_call_with_retry(name, call):
+    """Runs a Discord API call, retrying once after the advertised delay on a 429.
+
+    discord.py already sleeps and retries 429s itself, so this only kicks in once the
+    library has given up and raised.
+    """
+    try:
+        return await call()
+    except discord.HTTPException as e:
+        if e.status != 429:
+            raise
+        retry_after = get_retry_after(e.response.headers)
+        logging.warning(f"[{name}] Discord Rate Limit Hit (429). Retrying in {retry_after:.1f}s...")
+        await asyncio.sleep(retry_after)
+        return await call()
+
+@dataclass
+class PresenceUpdate:
+    """Sets the bot's status to the player's rank."""
+    rank: tuple
+    persisted = False
+
+    async def apply(self, bot) -> bool:
+        rank_name, rank_div, rank_score = self.rank
+        # Description: "Master 1 - 15000 RP"
+        status_text = f"{rank_name} {rank_div} - {rank_score:,} RP"
+        await bot.change_presence(activity=discord.Game(name=status_text))
+        logging.info(f"[{bot.config.name}] Status Updated: {status_text}")
+        return True
+
+    def commit(self, bot):
+        bot.last_known_rank_tuple = self.rank
+
+@dataclass
+class NicknameUpdate:
+    """Sets the bot's nickname in every server to the player's name."""
+    nick: str
+    persisted = True
+
+    async def apply(self, bot) -> bool:
+        return await bot.update_all_nicknames(self.nick)
+
+    def commit(self, bot):
+        bot.last_known_name = self.nick
+
+@dataclass
+class AvatarUpdate:
+    """Sets the bot's avatar to the player's rank badge."""
+    url: str
+    persisted = True
+
+    async def apply(self, bot) -> bool:
+        logging.info(f"[{bot.config.name}] Rank badge changed; updating avatar...")
+        return await bot.update_avatar(self.url)
+
+    def commit(self, bot):
+        bot.last_known_rank_img_url = self.url
 
 class ApexPlayerBot(discord.Client):
     def __init__(self, config: PlayerConfig, shared_session: aiohttp.ClientSession):
@@ -48,148 +163,301 @@ class ApexPlayerBot(discord.Client):
         
         self.config = config
         self.shared_session = shared_session
-        self.api_url = f"https://api.mozambiquehe.re/bridge?auth={APEX_API_KEY}&player={config.player_uid}&platform=PC"
+        # Built once as a yarl URL so aiohttp doesn't re-parse the string on every request
+        self.api_url = URL("https://api.mozambiquehe.re/bridge").with_query(
+            {"auth": APEX_API_KEY, "player": config.player_uid, "platform": "PC"}
+        )
         
         # Internal Memory
         self.last_known_name = None
-        self.last_known_score = None
+        self.last_known_rank_tuple: Optional[tuple] = None
+        self.last_known_rank_img_url = None
+        self._last_avatar_sha256 = None
+        self.load_state()
+
+    def load_state(self):
+        """Restores what was last pushed to Discord so a restart doesn't redo every update."""
+        state = load_state_file().get(self.config.name)
+        # Ignore state saved while the bot tracked a different player
+        if not state or state.get('player_uid') != self.config.player_uid:
+            return
+        self.last_known_name = state.get('last_known_name')
+        self.last_known_rank_img_url = state.get('last_known_rank_img_url')
+        if state.get('last_avatar_sha256'):
+            self._last_avatar_sha256 = bytes.fromhex(state['last_avatar_sha256'])
+        logging.info(f"[{self.config.name}] Restored state from {STATE_PATH}")
 
-    async def setup_hook(self):
-        self.update_stats_task.start()
+    async def save_state(self):
+        """Atomically writes this bot's state into the shared state file."""
+        async with _STATE_LOCK:
+            try:
+                state = load_state_file()
+                state[self.config.name] = {
+                    'player_uid': self.config.player_uid,
+                    'last_known_name': self.last_known_name,
+                    'last_known_rank_img_url': self.last_known_rank_img_url,
+                    'last_avatar_sha256': self._last_avatar_sha256.hex() if self._last_avatar_sha256 else None,
+                }
+                STATE_PATH.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = STATE_PATH.with_suffix('.tmp')
+                tmp_path.write_text(json.dumps(state, indent=2))
+                os.replace(tmp_path, STATE_PATH)
+            except OSError as e:
+                logging.error(f"[{self.config.name}] Failed to save state: {e}")
 
     async def on_ready(self):
         logging.info(f'[{self.config.name}] Logged in as {self.user} (ID: {self.user.id})')
         logging.info(f'[{self.config.name}] Tracking UID: {self.config.player_uid}')
 
-    @tasks.loop(seconds=STATS_CHECK_INTERVAL)
-    async def update_stats_task(self):
-        try:
-            async with self.shared_session.get(self.api_url) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    
-                    # === 1. PARSE DATA ===
-                    # Based on interface: global -> name / rank -> rankScore / rankImg
-                    global_info = data.get('global', {})
-                    rank_info = global_info.get('rank', {})
-                    
-                    player_name = global_info.get('name', 'Unknown')
-                    rank_score = rank_info.get('rankScore', 0)
-                    rank_name = rank_info.get('rankName', 'Rookie')
-                    rank_div = rank_info.get('rankDiv', 0)
-                    rank_img_url = rank_info.get('rankImg', None)
-
-                    # === 2. UPDATE STATUS (Description) ===
-                    # Description: "Master 1 - 15000 RP"
-                    status_text = f"{rank_name} {rank_div} - {rank_score:,} RP"
-                    
-                    # Only update if score changed to avoid spamming Discord API
-                    score_changed = status_text != self.last_known_score
-                    if score_changed:
-                        await self.change_presence(activity=discord.Game(name=status_text))
-                        logging.info(f"[{self.config.name}] Status Updated: {status_text}")
-                        self.last_known_score = status_text
-
-                    # === 3. UPDATE NICKNAME (Bot Name) ===
-                    # Only update if name is different
-                    if player_name != self.last_known_name:
-                        await self.update_all_nicknames(player_name)
-                        self.last_known_name = player_name
-
-                    # === 4. UPDATE AVATAR (Rank Badge) ===
-                    # Update avatar when the score changes so rank badge stays in sync
-                    if rank_img_url and score_changed:
-                        logging.info(f"[{self.config.name}] Score changed; updating avatar to current rank badge...")
-                        await self.update_avatar(rank_img_url)
-
-                elif response.status == 429:
-                    logging.warning(f"[{self.config.name}] Rate Limit Hit (429). Waiting...")
-                else:
-                    error_text = await response.text()
-                    logging.error(f"[{self.config.name}] API Failed: {response.status} - {error_text}")
+    def _diff(self, data) -> list:
+        """Works out which Discord updates a stats payload needs, without doing any I/O."""
+        # Based on interface: global -> name / rank -> rankScore / rankImg
+        global_info = data.get('global', {})
+        rank_info = global_info.get('rank', {})
+        
+        player_name = global_info.get('name', 'Unknown')
+        rank_score = rank_info.get('rankScore', 0)
+        rank_name = rank_info.get('rankName', 'Rookie')
+        rank_div = rank_info.get('rankDiv', 0)
+        rank_img_url = rank_info.get('rankImg', None)
 
-        except Exception as e:
-            logging.error(f"[{self.config.name}] Error in main loop: {e}", exc_info=True)
+        actions = []
 
-    async def update_all_nicknames(self, new_nick):
-        """Loops through all servers and updates the bot's nickname."""
-        logging.info(f"[{self.config.name}] Updating nickname to '{new_nick}'...")
-        for guild in self.guilds:
-            try:
-                # 'me' refers to the bot member in that guild
-                if guild.me.nick != new_nick:
-                    await guild.me.edit(nick=new_nick)
-            except discord.Forbidden:
-                logging.warning(f"[{self.config.name}] Missing permissions to change nickname in guild: {guild.name}")
-            except Exception as e:
-                logging.error(f"[{self.config.name}] Failed to change nickname in {guild.name}: {e}")
-
-    async def update_avatar(self, url):
+        # Status (Description): only when the rank changed to avoid spamming Discord API
+        current_rank = (rank_name, rank_div, rank_score)
+        if current_rank != self.last_known_rank_tuple:
+            actions.append(PresenceUpdate(current_rank))
+
+        # Nickname (Bot Name): only when the name is different
+        if player_name != self.last_known_name:
+            actions.append(NicknameUpdate(player_name))
+
+        # Avatar (Rank Badge): only when the badge itself changes (score moves within a tier keep the same badge)
+        if rank_img_url and rank_img_url != self.last_known_rank_img_url:
+            actions.append(AvatarUpdate(rank_img_url))
+
+        return actions
+
+    async def _commit(self, actions, results):
+        """Records the actions that succeeded so they aren't repeated next cycle."""
+        state_changed = False
+        for action, result in zip(actions, results):
+            if isinstance(result, BaseException):
+                logging.error(f"[{self.config.name}] {type(action).__name__} failed: {result}")
+            elif result:
+                action.commit(self)
+                state_changed = state_changed or action.persisted
+
+        if state_changed:
+            await self.save_state()
+
+    async def apply_stats(self, data):
+        """Applies a stats payload from the API to presence, nickname and avatar."""
+        actions = self._diff(data)
+        if not actions:
+            return
+        results = await asyncio.gather(*(a.apply(self) for a in actions), return_exceptions=True)
+        await self._commit(actions, results)
+
+    async def update_all_nicknames(self, new_nick) -> bool:
+        """Updates the bot's nickname in every server that doesn't have it yet, a few at a time.
+
+        Returns False if any server failed for a reason worth retrying next cycle.
+        """
+        # Resolve 'me' (the bot member in that guild) once per guild, skipping guilds already up to date
+        members = (guild.me for guild in self.guilds)
+        members_needing_update = [me for me in members if me is not None and me.nick != new_nick]
+        logging.info(f"[{self.config.name}] Updating nickname to '{new_nick}' in {len(members_needing_update)} servers...")
+        sem = asyncio.Semaphore(NICKNAME_MAX_CONCURRENCY)
+
+        async def patch(me):
+            async with sem:
+                try:
+                    await discord_call_with_retry(self.config.name, lambda: me.edit(nick=new_nick))
+                except discord.Forbidden:
+                    # Retrying won't help until someone grants the permission
+                    logging.warning(f"[{self.config.name}] Missing permissions to change nickname in guild: {me.guild.name}")
+                except Exception as e:
+                    logging.error(f"[{self.config.name}] Failed to change nickname in {me.guild.name}: {e}")
+                    return False
+                return True
+
+        results = await asyncio.gather(*(patch(me) for me in members_needing_update), return_exceptions=True)
+        return all(result is True for result in results)
+
+    async def update_avatar(self, url) -> bool:
+        """Sets the bot's avatar to the image at url, returns whether the avatar is now up to date."""
         try:
             async with self.shared_session.get(url) as resp:
                 if resp.status == 200:
                     raw_data = await resp.read()
+
+                    # Different URL but identical image bytes, skip Pillow and the Discord PATCH
+                    digest = hashlib.sha256(raw_data).digest()
+                    if digest == self._last_avatar_sha256:
+                        return True
                     
-                    # Pillow Processing
-                    # We convert to PNG and resize if necessary, but we avoid cropping
-                    # because Rank Badges have irregular shapes.
-                    image = Image.open(io.BytesIO(raw_data))
-                    
-                    # Convert to RGBA to preserve transparency
-                    if image.mode != 'RGBA':
-                        image = image.convert('RGBA')
+                    if raw_data[:8] == PNG_SIGNATURE and len(raw_data) < MAX_AVATAR_BYTES:
+                        # Rank badges are already PNGs Discord accepts, upload the original bytes
+                        avatar_bytes = raw_data
+                    else:
+                        # Pillow Processing (non-PNG sources like JPEG/WebP)
+                        # We convert to PNG and resize if necessary, but we avoid cropping
+                        # because Rank Badges have irregular shapes.
+                        image = Image.open(io.BytesIO(raw_data))
+
+                        # Convert to RGBA to preserve transparency, RGB sources have none to keep
+                        if image.mode not in ('RGBA', 'RGB'):
+                            image = image.convert('RGBA')
 
-                    output_buffer = io.BytesIO()
-                    image.save(output_buffer, format='PNG')
+                        # Shrink before encoding so the PNG encoder works on the smallest buffer
+                        image.thumbnail(AVATAR_SIZE, Image.Resampling.LANCZOS)
+
+                        # Fast deflate level, file size doesn't matter this far under the upload limit
+                        output_buffer = io.BytesIO()
+                        image.save(output_buffer, format='PNG', optimize=False, compress_level=1)
+                        avatar_bytes = output_buffer.getvalue()
                     
-                    await self.user.edit(avatar=output_buffer.getvalue())
+                    await discord_call_with_retry(self.config.name, lambda: self.user.edit(avatar=avatar_bytes))
+                    self._last_avatar_sha256 = digest
                     logging.info(f"[{self.config.name}] Profile Image updated to Ranked Badge.")
+                    return True
                 else:
                     logging.error(f"[{self.config.name}] Failed to download image: {resp.status}")
         except Exception as e:
             logging.error(f"[{self.config.name}] Failed to update avatar: {e}")
+        return False
+
+def mark_uid_invalid(bot: ApexPlayerBot, reason):
+    """Stops polling a bot's UID for NEGATIVE_CACHE_TTL after the API rejects it."""
+    _NEGATIVE_CACHE[bot.config.player_uid] = time.monotonic() + NEGATIVE_CACHE_TTL
+    logging.error(f"[{bot.config.name}] API rejected UID {bot.config.player_uid} ({reason}). Skipping it for {NEGATIVE_CACHE_TTL // 3600}h.")
+
+def clear_uid_invalid(uid):
+    """Forgets an earlier rejection once the API returns stats for the UID again."""
+    _NEGATIVE_CACHE.pop(uid, None)
+
+def is_uid_invalid(uid) -> bool:
+    """Whether the API rejected this UID less than NEGATIVE_CACHE_TTL ago."""
+    return time.monotonic() < _NEGATIVE_CACHE.get(uid, 0.0)
 
-    @update_stats_task.before_loop
-    async def before_update_stats_task(self):
-        await self.wait_until_ready()
-        # Add startup delay to stagger API calls and avoid rate limits
-        if self.config.startup_delay > 0:
-            logging.info(f"[{self.config.name}] Waiting {self.config.startup_delay} seconds before first API call to avoid rate limits...")
-            await asyncio.sleep(self.config.startup_delay)
+async def fetch_stats(bot: ApexPlayerBot, shared_session: aiohttp.ClientSession) -> Optional[dict]:
+    """Fetches the latest stats for one bot from the API, returns None on failure."""
+    for attempt in range(API_MAX_ATTEMPTS):
+        async with shared_session.get(bot.api_url) as response:
+            if response.status == 200:
+                data = orjson.loads(await response.read())
+                # The API reports unknown players in-band with a 200
+                if isinstance(data, dict) and data.get('Error'):
+                    mark_uid_invalid(bot, data['Error'])
+                    return None
+                clear_uid_invalid(bot.config.player_uid)
+                return data
+            elif response.status in (400, 404):
+                mark_uid_invalid(bot, f"HTTP {response.status}")
+                return None
+            elif response.status == 429:
+                # Wait as long as the API asks, backing off further on repeated hits
+                retry_after = min(get_retry_after(response.headers) * 2 ** attempt, MAX_RETRY_BACKOFF)
+                if attempt + 1 < API_MAX_ATTEMPTS:
+                    logging.warning(f"[{bot.config.name}] Rate Limit Hit (429). Retrying in {retry_after:.0f}s...")
+            else:
+                error_text = await response.text()
+                logging.error(f"[{bot.config.name}] API Failed: {response.status} - {error_text}")
+                return None
+
+        if attempt + 1 < API_MAX_ATTEMPTS:
+            await asyncio.sleep(retry_after)
+
+    logging.error(f"[{bot.config.name}] Still rate limited after {API_MAX_ATTEMPTS} attempts, giving up until next cycle.")
+    return None
+
+async def fetch_and_apply(bot: ApexPlayerBot, shared_session: aiohttp.ClientSession):
+    """Gets stats for one bot (from cache when another bot already fetched them) and hands them to it."""
+    uid = bot.config.player_uid
+    # UID was recently rejected by the API, don't ask again until it expires
+    if is_uid_invalid(uid):
+        return
+
+    try:
+        cached_at, data = _STATS_CACHE.get(uid, (0.0, None))
+        if data is None or time.monotonic() - cached_at >= STATS_CACHE_TTL:
+            data = await fetch_stats(bot, shared_session)
+            if data is not None:
+                _STATS_CACHE[uid] = (time.monotonic(), data)
+        else:
+            logging.info(f"[{bot.config.name}] Using cached stats for UID {uid}")
+
+        if data is not None:
+            await bot.apply_stats(data)
+
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+        # Expected now and then (connection resets, timeouts), no traceback needed
+        logging.warning(f"[{bot.config.name}] Transient network error: {e!r}")
+    except Exception:
+        logging.exception(f"[{bot.config.name}] Unexpected error in main loop")
+
+async def stats_poller(bots: list[ApexPlayerBot], shared_session: aiohttp.ClientSession):
+    """Single polling loop for all bots, spreading API calls evenly over the check interval."""
+    # One request every STATS_CHECK_INTERVAL / N seconds keeps the API load flat
+    pacing = STATS_CHECK_INTERVAL / len(bots)
+    loop = asyncio.get_running_loop()
+    # Ticks are scheduled on absolute deadlines so slow API calls don't push later ones back
+    start = loop.time()
+    next_tick = start
+    first_pass = True
+    while True:
+        for bot in bots:
+            await asyncio.sleep(max(0, next_tick - loop.time()))
+            next_tick += STARTUP_POLL_STAGGER if first_pass else pacing
+            if bot.is_closed():
+                continue
+            if not bot.is_ready():
+                # Never 0: when running behind schedule wait_for(timeout=0) times out immediately
+                timeout = max(BOT_READY_MIN_TIMEOUT, next_tick - loop.time())
+                try:
+                    await asyncio.wait_for(bot.wait_until_ready(), timeout=timeout)
+                except asyncio.TimeoutError:
+                    logging.warning(f"[{bot.config.name}] Bot not ready yet, skipping this cycle...")
+                    continue
+            await fetch_and_apply(bot, shared_session)
+
+        if first_pass:
+            # Settle into the even spacing, bot k is next polled at start + (k + 1) * pacing
+            first_pass = False
+            next_tick = start + pacing
 
 def parse_player_configs() -> list[PlayerConfig]:
     """Parse all player configurations from environment variables."""
     configs = []
     
-    # Look for all DISCORD_BOT_TOKEN_* and PLAYER_UID_* pairs
-    env_vars = dict(os.environ)
-    
-    # Find all player tokens
-    player_tokens = {k: v for k, v in env_vars.items() if k.startswith('DISCORD_BOT_TOKEN_') and k != 'DISCORD_BOT_TOKEN_MAP'}
+    # Group DISCORD_BOT_TOKEN_* and PLAYER_UID_* by player name in a single pass
+    # (e.g., DISCORD_BOT_TOKEN_DAAN and PLAYER_UID_DAAN -> DAAN)
+    players = defaultdict(dict)
+    for key, value in os.environ.items():
+        if key == 'DISCORD_BOT_TOKEN_MAP':
+            continue
+        for prefix, field in (('DISCORD_BOT_TOKEN_', 'token'), ('PLAYER_UID_', 'uid')):
+            if key.startswith(prefix):
+                players[key[len(prefix):].upper()][field] = value
+                break
     
-    for token_key, token_value in player_tokens.items():
-        # Extract player name from token key (e.g., DISCORD_BOT_TOKEN_DAAN -> DAAN)
-        player_name = token_key.replace('DISCORD_BOT_TOKEN_', '').upper()
-        
-        # Find corresponding UID
-        uid_key = f'PLAYER_UID_{player_name}'
-        player_uid = env_vars.get(uid_key)
+    for player_name, fields in players.items():
+        # Only players with a bot token get a bot
+        if 'token' not in fields:
+            continue
         
+        player_uid = fields.get('uid')
         if not player_uid:
-            logging.warning(f"Missing {uid_key} for player {player_name}, skipping...")
+            logging.warning(f"Missing PLAYER_UID_{player_name} for player {player_name}, skipping...")
             continue
         
-        # Get startup delay (optional, defaults to 0)
-        delay_key = f'STARTUP_DELAY_{player_name}'
-        startup_delay = int(env_vars.get(delay_key, '0'))
-        
         configs.append(PlayerConfig(
             name=player_name,
-            discord_token=token_value,
-            player_uid=player_uid,
-            startup_delay=startup_delay
+            discord_token=fields['token'],
+            player_uid=player_uid
         ))
-        logging.info(f"Loaded config for player: {player_name} (UID: {player_uid}, delay: {startup_delay}s)")
+        logging.info(f"Loaded config for player: {player_name} (UID: {player_uid})")
     
     if not configs:
         logging.fatal("No player configurations found! Ensure DISCORD_BOT_TOKEN_* and PLAYER_UID_* are set in .env")
@@ -197,13 +465,12 @@ def parse_player_configs() -> list[PlayerConfig]:
     
     return configs
 
-async def run_bot(config: PlayerConfig, shared_session: aiohttp.ClientSession):
+async def run_bot(bot: ApexPlayerBot):
     """Run a single bot instance."""
-    bot = ApexPlayerBot(config, shared_session)
     try:
-        await bot.start(config.discord_token)
+        await bot.start(bot.config.discord_token)
     except Exception as e:
-        logging.error(f"[{config.name}] Bot crashed: {e}", exc_info=True)
+        logging.error(f"[{bot.config.name}] Bot crashed: {e}", exc_info=True)
     finally:
         await bot.close()
 
@@ -213,18 +480,44 @@ async def main():
     player_configs = parse_player_configs()
     
     # Create shared HTTP session for better connection pooling
-    connector = aiohttp.TCPConnector(limit=10, limit_per_host=5)
+    # DNS results are cached for a full polling interval. Polls are too far apart to share a
+    # connection, but keep-alive lets the rank badge download right after a stats fetch reuse
+    # the open TLS connection when the badge is served from the same host
+    connector = aiohttp.TCPConnector(
+        limit=20,
+        limit_per_host=4,
+        ttl_dns_cache=STATS_CHECK_INTERVAL,
+        keepalive_timeout=75,
+        enable_cleanup_closed=True
+    )
     timeout = aiohttp.ClientTimeout(total=30)
-    shared_session = aiohttp.ClientSession(connector=connector, timeout=timeout)
+    shared_session = aiohttp.ClientSession(
+        connector=connector,
+        timeout=timeout,
+        headers={'Connection': 'keep-alive'}
+    )
+    
+    bots = [ApexPlayerBot(config, shared_session) for config in player_configs]
+    poller = None
     
     try:
-        # Run all bots concurrently
-        tasks = [run_bot(config, shared_session) for config in player_configs]
-        await asyncio.gather(*tasks)
+        # Run all bots concurrently, with one shared task polling the API for all of them
+        bot_runs = asyncio.gather(*(run_bot(bot) for bot in bots))
+        poller = asyncio.create_task(stats_poller(bots, shared_session))
+        await bot_runs
     finally:
+        if poller:
+            poller.cancel()
         await shared_session.close()
 
 if __name__ == '__main__':
+    # Use the faster libuv event loop when available
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
     try:
         asyncio.run(main())
     except KeyboardInterrupt: